@@ -1,12 +1,13 @@
 """
 API router for the Game Server Dashboard application.
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
-from fastapi import APIRouter, Path, Query, Request
+from fastapi import APIRouter, Body, Depends, Path, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from app.kubernetes import get_k8s_client
+from app.kubernetes import KubernetesClient, get_k8s_client
 from app.kubernetes.client import DeploymentStatus, Game, GameInstance
 
 router = APIRouter(tags=["deployments"])
@@ -19,6 +20,26 @@ class DeploymentActionResponse(BaseModel):
     message: str
 
 
+class DeploymentRef(BaseModel):
+    """Reference to a single deployment."""
+
+    namespace: str
+    name: str
+
+
+class DeploymentBatchRequest(BaseModel):
+    """Request model for the batch deployment action endpoint."""
+
+    deployments: List[DeploymentRef]
+
+
+class DeploymentBatchResult(DeploymentRef):
+    """Outcome of a batch action for a single deployment."""
+
+    status: str
+    message: str
+
+
 class PodInfo(BaseModel):
     """Model for pod information."""
     
@@ -35,112 +56,141 @@ class PodLogResponse(BaseModel):
     logs: str
 
 
+def _records_response(records: Sequence[Any]) -> ORJSONResponse:
+    """Serialize a list of internal dataclass records with orjson.
+
+    Bypasses FastAPI's jsonable_encoder and response model validation; orjson
+    encodes the dataclasses natively. The documented schema is the matching
+    pydantic model.
+    """
+    return ORJSONResponse(records)
+
+
 @router.get(
     "/deployments",
-    response_model=List[DeploymentStatus],
+    responses={200: {"model": List[DeploymentStatus]}},
     summary="Get all game server deployments",
 )
 async def get_deployments(
-    request: Request,
     namespace: str = Query(None, description="Filter deployments by namespace"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Get all game server deployments.
 
     Returns a list of all deployments with game-server annotations.
     Optionally filter by namespace.
     """
-    k8s_client = await get_k8s_client(request)
-    return await k8s_client.get_deployments(namespace=namespace)
+    return _records_response(await k8s_client.get_deployments(namespace=namespace))
 
 
 @router.post(
     "/deployments/{namespace}/{name}/start",
-    response_model=DeploymentActionResponse,
+    responses={200: {"model": DeploymentActionResponse}},
     summary="Start a deployment",
 )
 async def start_deployment(
-    request: Request,
     namespace: str = Path(..., description="Namespace of the deployment"),
     name: str = Path(..., description="Name of the deployment"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Start a specific deployment (set replicas to 1).
 
     Scales the deployment to 1 replica.
     """
-    k8s_client = await get_k8s_client(request)
-    result = await k8s_client.scale_deployment(namespace=namespace, name=name, replicas=1)
-    return DeploymentActionResponse(status=result["status"], message=result["message"])
+    return ORJSONResponse(
+        await k8s_client.scale_deployment(namespace=namespace, name=name, replicas=1)
+    )
 
 
 @router.post(
     "/deployments/{namespace}/{name}/restart",
-    response_model=DeploymentActionResponse,
+    responses={200: {"model": DeploymentActionResponse}},
     summary="Restart a deployment",
 )
 async def restart_deployment(
-    request: Request,
     namespace: str = Path(..., description="Namespace of the deployment"),
     name: str = Path(..., description="Name of the deployment"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Restart a specific deployment.
 
     Executes a rollout restart on the specified deployment.
     """
-    k8s_client = await get_k8s_client(request)
-    result = await k8s_client.restart_deployment(namespace=namespace, name=name)
-    return DeploymentActionResponse(status=result["status"], message=result["message"])
+    return ORJSONResponse(
+        await k8s_client.restart_deployment(namespace=namespace, name=name)
+    )
 
 
 @router.post(
     "/deployments/{namespace}/{name}/stop",
-    response_model=DeploymentActionResponse,
+    responses={200: {"model": DeploymentActionResponse}},
     summary="Stop a deployment",
 )
 async def stop_deployment(
-    request: Request,
     namespace: str = Path(..., description="Namespace of the deployment"),
     name: str = Path(..., description="Name of the deployment"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Stop a specific deployment (set replicas to 0).
 
     Scales the deployment to 0 replicas.
     """
-    k8s_client = await get_k8s_client(request)
-    result = await k8s_client.scale_deployment(namespace=namespace, name=name, replicas=0)
-    return DeploymentActionResponse(status=result["status"], message=result["message"])
+    return ORJSONResponse(
+        await k8s_client.scale_deployment(namespace=namespace, name=name, replicas=0)
+    )
+
+
+@router.post(
+    "/deployments/batch/{action}",
+    responses={200: {"model": List[DeploymentBatchResult]}},
+    summary="Start, stop or restart several deployments",
+)
+async def batch_deployment_action(
+    action: Literal["start", "stop", "restart"] = Path(..., description="Action to apply"),
+    request: DeploymentBatchRequest = Body(...),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
+):
+    """Apply the same action to several deployments at once.
+
+    The API requests are issued concurrently. A failure for one deployment is
+    reported in its result and does not affect the others.
+    """
+    return ORJSONResponse(
+        await k8s_client.batch_deployment_action(
+            action, [d.model_dump() for d in request.deployments]
+        )
+    )
 
 
 @router.get(
     "/games",
-    response_model=List[Game],
+    responses={200: {"model": List[Game]}},
     summary="Get all games",
 )
 async def get_games(
-    request: Request,
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Get a list of all games.
 
     Returns a list of all games with their instance and component counts.
     """
-    k8s_client = await get_k8s_client(request)
-    return await k8s_client.get_games()
+    return Response(content=await k8s_client.get_games_json(), media_type="application/json")
 
 
 @router.get(
     "/games/{game_name}/instances",
-    response_model=List[GameInstance],
+    responses={200: {"model": List[GameInstance]}},
     summary="Get instances for a game",
 )
 async def get_game_instances(
-    request: Request,
     game_name: str = Path(..., description="Name of the game"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Get all instances for a specific game.
 
     Returns a list of all instances with their component deployments.
     """
-    k8s_client = await get_k8s_client(request)
-    return await k8s_client.get_game_instances(game_name=game_name)
+    return _records_response(await k8s_client.get_game_instances(game_name=game_name))
 
 
 @router.get(
@@ -149,39 +199,37 @@ async def get_game_instances(
     summary="Get pods for a deployment",
 )
 async def get_deployment_pods(
-    request: Request,
     namespace: str = Path(..., description="Namespace of the deployment"),
     name: str = Path(..., description="Name of the deployment"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Get all pods for a specific deployment.
 
     Returns a list of all pods managed by the deployment sorted by creation time (newest first).
     """
-    k8s_client = await get_k8s_client(request)
     return await k8s_client.get_deployment_pods(namespace=namespace, name=name)
 
 
 @router.get(
     "/pods/{namespace}/{name}/logs",
-    response_model=PodLogResponse,
+    responses={200: {"model": PodLogResponse}},
     summary="Get logs from a pod",
 )
 async def get_pod_logs(
-    request: Request,
     namespace: str = Path(..., description="Namespace of the pod"),
     name: str = Path(..., description="Name of the pod"),
     container: str = Query(None, description="Container name (if not provided, logs from first container)"),
     tail_lines: int = Query(100, description="Number of lines to fetch from the end of the logs"),
+    k8s_client: KubernetesClient = Depends(get_k8s_client),
 ):
     """Get logs from a pod container.
 
     Returns the container logs as a text string.
     """
-    k8s_client = await get_k8s_client(request)
     logs = await k8s_client.get_pod_logs(
         namespace=namespace, 
         pod_name=name,
         container=container,
         tail_lines=tail_lines
     )
-    return PodLogResponse(logs=logs)
+    return ORJSONResponse({"logs": logs})
@@ -1,6 +1,7 @@
 """
 Kubernetes client module for interacting with the K8s API.
 """
+from .cache import DeploymentCache
 from .client import KubernetesClient, get_k8s_client
 
-__all__ = ["KubernetesClient", "get_k8s_client"]
+__all__ = ["DeploymentCache", "KubernetesClient", "get_k8s_client"]
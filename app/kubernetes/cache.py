@@ -0,0 +1,315 @@
+"""
+Watch-backed in-memory cache of game server deployments.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from kubernetes_asyncio import client, watch
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.exceptions import ApiException
+
+from .client import (
+    DEPLOYMENT_LABEL_SELECTOR,
+    DeploymentRecord,
+    Game,
+    list_pages,
+    process_deployment_item,
+)
+
+logger = logging.getLogger(__name__)
+
+# Server-side timeout for a single watch request; the watch is resumed from
+# the last seen resource version afterwards
+WATCH_TIMEOUT_SECONDS = 300
+# Delay before retrying after an unexpected watch or list failure
+RETRY_DELAY_SECONDS = 5
+
+DeploymentKey = Tuple[str, str]
+
+
+class DeploymentCache:
+    """Cache of game server deployments kept current by a Kubernetes watch.
+
+    A single background task lists all deployments once and then applies
+    ADDED/MODIFIED/DELETED watch events, so request handlers can read the
+    current state without a round-trip to the API server. Only deployments
+    carrying the game annotation are stored, as ready-built DeploymentRecord
+    objects that are only rebuilt when the deployment's resourceVersion
+    changes. Returned objects are shared; they are frozen for that reason.
+
+    Per-game instance/component counts and the number of failing deployments
+    are maintained incrementally as events arrive, so game summaries never
+    need a scan over all deployments.
+    """
+
+    def __init__(self, api_client: ApiClient):
+        """Initialize the deployment cache.
+
+        Args:
+            api_client: Kubernetes API client used for the list and watch calls
+        """
+        self.api_client = api_client
+        self.apps_v1_api = client.AppsV1Api(api_client=api_client)
+        self._by_key: Dict[DeploymentKey, DeploymentRecord] = {}
+        self._by_game: Dict[str, Dict[DeploymentKey, DeploymentRecord]] = {}
+        self._by_namespace: Dict[str, Dict[DeploymentKey, DeploymentRecord]] = {}
+        self._resource_versions: Dict[DeploymentKey, str] = {}
+        # Prebuilt list of all deployments, invalidated on every mutation
+        self._all: Optional[List[DeploymentRecord]] = None
+        # game -> {"instances": Counter, "components": Counter, "failing": int}
+        self._games: Dict[str, Dict[str, Any]] = {}
+        # Sorted and serialized game summaries, invalidated on every mutation
+        self._games_list: Optional[List[Game]] = None
+        self._games_json: Optional[bytes] = None
+        self._synced = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the cache holds a complete view of the cluster."""
+        return self._synced
+
+    def start(self) -> None:
+        """Start the background list/watch task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background list/watch task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._synced = False
+
+    def deployments(self, namespace: Optional[str] = None) -> List[DeploymentRecord]:
+        """Get the cached game server deployments.
+
+        Args:
+            namespace: Optional namespace to filter deployments
+
+        Returns:
+            List of deployment status objects
+        """
+        if namespace is None:
+            if self._all is None:
+                self._all = list(self._by_key.values())
+            return self._all
+        return list(self._by_namespace.get(namespace, {}).values())
+
+    def get(self, namespace: str, name: str) -> Optional[DeploymentRecord]:
+        """Get a single cached deployment.
+
+        Args:
+            namespace: Namespace of the deployment
+            name: Name of the deployment
+
+        Returns:
+            Deployment record, or None if it is not a cached game server deployment
+        """
+        return self._by_key.get((namespace, name))
+
+    def deployments_for_game(self, game_name: str) -> List[DeploymentRecord]:
+        """Get the cached deployments belonging to a single game.
+
+        Args:
+            game_name: Name of the game
+
+        Returns:
+            List of deployment status objects
+        """
+        return list(self._by_game.get(game_name, {}).values())
+
+    def games(self) -> List[Game]:
+        """Get a summary of all games from the maintained aggregates.
+
+        Returns:
+            List of game objects sorted by name
+        """
+        if self._games_list is None:
+            self._games_list = [
+                Game.model_construct(
+                    name=game_name,
+                    instance_count=len(stats["instances"]),
+                    component_count=len(stats["components"]),
+                    failing_deployments=stats["failing"],
+                )
+                for game_name, stats in sorted(self._games.items())
+            ]
+        return self._games_list
+
+    def games_json(self) -> bytes:
+        """Get the game summaries serialized as a JSON array.
+
+        Returns:
+            JSON encoded list of games, as returned by games()
+        """
+        if self._games_json is None:
+            self._games_json = orjson.dumps([g.model_dump() for g in self.games()])
+        return self._games_json
+
+    async def _run(self) -> None:
+        """List and then watch deployments until cancelled."""
+        resource_version = None
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = await self._list()
+                resource_version = await self._watch(resource_version)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                if e.status == 410:
+                    # Our resource version is too old, start over with a fresh list
+                    logger.info("Deployment watch expired, relisting")
+                    resource_version = None
+                    continue
+                if e.status == 403:
+                    logger.warning(
+                        f"Not allowed to watch deployments cluster-wide, cache disabled: {e}"
+                    )
+                    self._synced = False
+                    return
+                logger.error(f"Error watching deployments: {e}")
+                resource_version = None
+                # Requests fall back to direct LISTs until the next successful
+                # relist instead of reading a snapshot that is no longer kept current
+                self._synced = False
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+            except Exception as e:
+                logger.error(f"Unexpected error watching deployments: {e}", exc_info=True)
+                resource_version = None
+                self._synced = False
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+    async def _list(self) -> str:
+        """Replace the cache contents with a fresh list of all deployments.
+
+        Returns:
+            Resource version to start watching from
+        """
+        # resource_version="0" lets the API server answer from its watch cache
+        # instead of performing a quorum read against etcd
+        seen = set()
+        async for response in list_pages(
+            self.apps_v1_api.list_deployment_for_all_namespaces,
+            label_selector=DEPLOYMENT_LABEL_SELECTOR,
+            resource_version="0",
+            resource_version_match="NotOlderThan",
+        ):
+            for item in response.items:
+                seen.add((item.metadata.namespace, item.metadata.name))
+                self._apply("ADDED", item)
+        # Drop deployments that were deleted while we were not watching
+        for key in [key for key in self._resource_versions if key not in seen]:
+            self._remove(key)
+        self._synced = True
+        logger.info(f"Deployment cache synced with {len(self._by_key)} game server deployments")
+        return response.metadata.resource_version
+
+    async def _watch(self, resource_version: str) -> str:
+        """Apply watch events until the server closes the stream.
+
+        Args:
+            resource_version: Resource version to start watching from
+
+        Returns:
+            Last resource version seen, to resume watching from
+        """
+        w = watch.Watch()
+        async with w:
+            async for event in w.stream(
+                self.apps_v1_api.list_deployment_for_all_namespaces,
+                label_selector=DEPLOYMENT_LABEL_SELECTOR,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            ):
+                if event["type"] != "BOOKMARK":
+                    self._apply(event["type"], event["object"])
+        return w.resource_version or resource_version
+
+    def _apply(self, event_type: str, item: client.V1Deployment) -> None:
+        """Apply a single watch event to the cache.
+
+        Args:
+            event_type: Watch event type (ADDED, MODIFIED or DELETED)
+            item: Kubernetes deployment object
+        """
+        key = (item.metadata.namespace, item.metadata.name)
+        if event_type == "DELETED":
+            self._remove(key)
+            return
+
+        resource_version = item.metadata.resource_version
+        if resource_version and self._resource_versions.get(key) == resource_version:
+            return  # Unchanged since we last built it
+
+        deployment = process_deployment_item(item)
+        self._remove(key)
+        if deployment is None:
+            return  # Not a game server deployment
+
+        self._resource_versions[key] = resource_version
+        self._by_key[key] = deployment
+        self._by_game.setdefault(deployment.game, {})[key] = deployment
+        self._by_namespace.setdefault(deployment.namespace, {})[key] = deployment
+        self._invalidate()
+
+        stats = self._games.setdefault(
+            deployment.game, {"instances": Counter(), "components": Counter(), "failing": 0}
+        )
+        stats["instances"][deployment.instance] += 1
+        stats["components"][(deployment.instance, deployment.component)] += 1
+        if deployment.status == "failed":
+            stats["failing"] += 1
+
+    def _invalidate(self) -> None:
+        """Drop the derived views after the cache contents changed."""
+        self._all = None
+        self._games_list = None
+        self._games_json = None
+
+    def _remove(self, key: DeploymentKey) -> None:
+        """Remove a deployment from the cache and its indexes.
+
+        Args:
+            key: (namespace, name) of the deployment
+        """
+        deployment = self._by_key.pop(key, None)
+        if deployment is None:
+            return
+        del self._resource_versions[key]
+        self._invalidate()
+
+        namespace_items = self._by_namespace[deployment.namespace]
+        del namespace_items[key]
+        if not namespace_items:
+            del self._by_namespace[deployment.namespace]
+
+        game_items = self._by_game[deployment.game]
+        del game_items[key]
+        if not game_items:
+            # Last deployment of this game is gone, drop its aggregates as well
+            del self._by_game[deployment.game]
+            del self._games[deployment.game]
+            return
+
+        stats = self._games[deployment.game]
+        _decrement(stats["instances"], deployment.instance)
+        _decrement(stats["components"], (deployment.instance, deployment.component))
+        if deployment.status == "failed":
+            stats["failing"] -= 1
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    """Decrement a reference count, dropping the key once it reaches zero."""
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
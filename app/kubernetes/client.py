@@ -1,24 +1,47 @@
 """
 Kubernetes client implementation for interacting with the K8s API.
 """
+import asyncio
+import copy
+import dataclasses
+import functools
+import hashlib
 import logging
 import os
-import sys
-from typing import Any, Dict, List, Optional
+import re
+import time
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
+import orjson
 from fastapi import HTTPException, Request
 from pydantic import BaseModel
 
-from kubernetes import client, config
-from kubernetes.client.api_client import ApiClient
-from kubernetes.client.exceptions import ApiException
+from kubernetes_asyncio import client, config
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.exceptions import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
 
-# Configure root logger to ensure our logs are displayed
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+from .instrumentation import THROTTLE_RETRIES_TOTAL, instrument_api_client
+
+if TYPE_CHECKING:
+    from .cache import DeploymentCache
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +50,87 @@ GAME_ANNOTATION = "game-server/game"
 INSTANCE_ANNOTATION = "game-server/instance"
 COMPONENT_ANNOTATION = "game-server/component"
 FILES_URL_ANNOTATION = "game-server/files-url"
+# Request headers that may carry the user's bearer token, in lookup order:
+# standard, set by proxies, Kubernetes specific. Lowercase like Starlette's.
+AUTH_HEADERS = ("authorization", "x-forwarded-authorization", "x-auth-token")
+# Pod template annotation kubectl rollout restart sets to trigger a rollout
+RESTART_ANNOTATION = "kubectl.kubernetes.io/restartedAt"
+
+# Optional label selector applied to deployment LISTs and watches, so the API
+# server does the filtering. Unset by default: game server deployments are
+# identified by the game annotation, which is not selectable. Set it to
+# GAME_LABEL ("game-server/game") once all game server deployments carry that
+# label as well.
+GAME_LABEL = "game-server/game"
+DEPLOYMENT_LABEL_SELECTOR = os.environ.get("DEPLOYMENT_LABEL_SELECTOR") or None
+# Syntax of Kubernetes label values (at most 63 characters)
+_LABEL_VALUE_RE = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
+
+# Resource version for LIST requests that lets the API server answer from its
+# watch cache instead of a quorum read from etcd. The result may lag the
+# latest state by a moment, which is fine for a dashboard.
+WATCH_CACHE_RESOURCE_VERSION = "0"
+
+# Resource quantity suffixes, as millicores per unit and bytes per unit
+_CPU_UNITS = {"n": 1e-6, "u": 1e-3, "m": 1.0, "": 1000.0}
+_MEMORY_UNITS = {
+    "Ki": 2**10, "Mi": 2**20, "Gi": 2**30, "Ti": 2**40, "Pi": 2**50, "Ei": 2**60,
+    "k": 10**3, "K": 10**3, "M": 10**6, "G": 10**9, "T": 10**12, "P": 10**15, "E": 10**18,
+    "": 1,
+}
+_CPU_QUANTITY_RE = re.compile(r"^(\d+(?:\.\d+)?)([num]?)$")
+_MEMORY_QUANTITY_RE = re.compile(r"^(\d+(?:\.\d+)?)(Ki|Mi|Gi|Ti|Pi|Ei|[kKMGTPE]?)$")
+# (divisor, suffix) of displayed memory usage, indexed by (bit_length() - 1) // 10
+_MEMORY_DISPLAY_UNITS = ((1, "B"), (1 << 10, "Ki"), (1 << 20, "Mi"), (1 << 30, "Gi"))
+# Usage shown when a deployment has no pod metrics, or fetching them failed
+METRICS_UNAVAILABLE = "N/A"
+METRICS_ERROR = "Error"
+# Number of distinct metrics quantity strings whose parsed value is memoized
+QUANTITY_CACHE_SIZE = 4096
+
+# Number of distinct matchLabels selectors whose selector string is memoized
+SELECTOR_CACHE_SIZE = 4096
+
+# Content codings accepted from the API server
+K8S_ACCEPT_ENCODING = "gzip"
+
+# Times a request rejected with 429 Too Many Requests is retried, and the
+# longest Retry-After delay honored between attempts
+THROTTLE_RETRIES = int(os.environ.get("K8S_THROTTLE_RETRIES", "3"))
+THROTTLE_MAX_DELAY_SECONDS = 10.0
+
+# Number of objects requested per page when listing
+LIST_PAGE_SIZE = 500
+
+# Seconds a direct deployment LIST is reused when no synced cache is available,
+# 0 disables reuse
+LIST_CACHE_TTL = float(os.environ.get("K8S_LIST_CACHE_TTL", "5"))
+# Seconds the namespaces a client may list deployments in are reused
+NAMESPACE_CACHE_TTL = float(os.environ.get("K8S_NAMESPACE_CACHE_TTL", "60"))
+# Seconds pod metrics of a namespace/selector are reused
+METRICS_CACHE_TTL = float(os.environ.get("K8S_METRICS_CACHE_TTL", "10"))
+# Number of cached results above which expired ones are dropped
+RESULT_CACHE_PRUNE_SIZE = 1024
+
+# Maximum number of API requests a single client issues concurrently when
+# fanning out over deployments or namespaces
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("K8S_MAX_CONCURRENCY", "16"))
+
+# Maximum number of per-token API clients kept open at the same time
+TOKEN_CLIENT_CACHE_SIZE = 128
+# Per-token API clients unused for this long are closed
+TOKEN_CLIENT_IDLE_SECONDS = 300
+# Maximum concurrent connections of a single per-token API client
+TOKEN_CLIENT_POOL_SIZE = 20
+# CA bundle per-token clients verify the API server certificate against;
+# verification is skipped when the file does not exist (local development)
+K8S_CA_CERT = os.environ.get(
+    "K8S_CA_CERT", "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
+)
+
+# Results memoized for the lifetime of a single HTTP request, set up by
+# get_k8s_client(). The dict is shared with tasks spawned by the request.
+_request_memo: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("k8s_request_memo", default=None)
 
 
 class DeploymentStatus(BaseModel):
@@ -67,19 +171,377 @@ class Game(BaseModel):
     failing_deployments: int
 
 
+@dataclass(frozen=True)
+class DeploymentRecord:
+    """Internal deployment status record with the fields of DeploymentStatus.
+
+    Used for cached and enriched deployments instead of the pydantic model, so
+    no validation runs per object. orjson serializes it directly. __slots__ is
+    spelled out because dataclass(slots=True) needs Python 3.10.
+    """
+
+    __slots__ = (
+        "name", "namespace", "game", "instance", "component", "replicas",
+        "available_replicas", "unavailable_replicas", "status", "conditions",
+        "cpu_usage", "memory_usage", "selector_labels", "files_url",
+    )
+
+    name: str
+    namespace: str
+    game: str
+    instance: str
+    component: str
+    replicas: int
+    available_replicas: Optional[int]
+    unavailable_replicas: Optional[int]
+    status: str
+    conditions: List[Dict[str, Any]]
+    cpu_usage: Optional[str]
+    memory_usage: Optional[str]
+    selector_labels: Dict[str, str]
+    files_url: Optional[str]
+
+
+@dataclass(frozen=True)
+class GameInstanceRecord:
+    """Internal game instance record with the fields of GameInstance."""
+
+    __slots__ = ("name", "components")
+
+    name: str
+    components: List[DeploymentRecord]
+
+
+@functools.lru_cache(maxsize=QUANTITY_CACHE_SIZE)
+def parse_cpu_quantity(cpu_str: str) -> float:
+    """Parse a CPU quantity such as "250m" or "1" to millicores.
+
+    Args:
+        cpu_str: Kubernetes CPU quantity
+
+    Returns:
+        Millicores
+    """
+    match = _CPU_QUANTITY_RE.match(cpu_str)
+    if match is None:
+        # Exponent notation and the like, in cores
+        return float(cpu_str) * 1000
+    return float(match.group(1)) * _CPU_UNITS[match.group(2)]
+
+
+@functools.lru_cache(maxsize=QUANTITY_CACHE_SIZE)
+def parse_memory_quantity(memory_str: str) -> int:
+    """Parse a memory quantity such as "256Mi" or "1G" to bytes.
+
+    Args:
+        memory_str: Kubernetes memory quantity
+
+    Returns:
+        Bytes
+    """
+    match = _MEMORY_QUANTITY_RE.match(memory_str)
+    if match is None:
+        # Exponent notation and the like, in bytes
+        return int(float(memory_str))
+    return int(float(match.group(1)) * _MEMORY_UNITS[match.group(2)])
+
+
+@functools.lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def label_selector_for(match_labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Build a label selector string, memoized since deployments rarely change.
+
+    Args:
+        match_labels: Items of a matchLabels dict
+
+    Returns:
+        Label selector matching all given labels
+    """
+    return ",".join(f"{key}={value}" for key, value in match_labels)
+
+
+async def list_pages(list_fn: Callable[..., Awaitable[Any]], **kwargs: Any) -> AsyncIterator[Any]:
+    """Iterate over the pages of a paginated LIST request.
+
+    Follow-up pages are requested with the continue token of the previous
+    page. They must not set a resource version, the token already pins the
+    snapshot, so resource_version(_match) only apply to the first request.
+
+    With _preload_content=False each page is decoded with orjson into plain
+    dicts, skipping the client's much slower model deserialization.
+
+    Args:
+        list_fn: Generated list_* API method
+        **kwargs: Arguments for list_fn, limit defaults to LIST_PAGE_SIZE
+
+    Yields:
+        LIST responses, one per page
+    """
+    kwargs.setdefault("limit", LIST_PAGE_SIZE)
+    raw = kwargs.get("_preload_content") is False
+    while True:
+        response = await list_fn(**kwargs)
+        if raw:
+            response = await _read_json(response)
+            token = response["metadata"].get("continue")
+        else:
+            token = response.metadata._continue
+        yield response
+        if not token:
+            return
+        kwargs.pop("resource_version", None)
+        kwargs.pop("resource_version_match", None)
+        kwargs["_continue"] = token
+
+
+async def _read_json(response: Any) -> Any:
+    """Decode a response requested with _preload_content=False.
+
+    Args:
+        response: Raw aiohttp response
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        ApiException: If the API server returned an error status
+    """
+    data = await response.read()
+    if not 200 <= response.status <= 299:
+        raise ApiException(http_resp=RESTResponse(response, data))
+    return orjson.loads(data)
+
+
+def process_deployment_item(item) -> Optional[DeploymentRecord]:
+    """Process a single deployment item to create a DeploymentRecord object.
+
+    Args:
+        item: Kubernetes deployment object
+
+    Returns:
+        DeploymentRecord object or None if not a game server deployment
+    """
+    metadata = item.metadata
+    spec = item.spec
+    item_status = item.status
+
+    # Check if the deployment has our game annotations, falling back to the
+    # game label used for server-side filtering
+    annotations = metadata.annotations or {}
+    game = annotations.get(GAME_ANNOTATION) or (metadata.labels or {}).get(GAME_LABEL)
+
+    if not game:
+        return None  # Skip deployments without our game annotation
+
+    # Get deployment status. A deployment is "active" when it is scaled to
+    # zero or has available replicas, "failed" otherwise.
+    available_replicas = item_status.available_replicas or 0
+    status = "active" if spec.replicas == 0 or available_replicas > 0 else "failed"
+
+    # Status and conditions are computed once here; the cache only rebuilds
+    # the record when the deployment's resourceVersion changes
+    conditions = [
+        {
+            "type": condition.type,
+            "status": condition.status,
+            "message": condition.message,
+            "last_transition_time": condition.last_transition_time.isoformat()
+            if condition.last_transition_time else None,
+        }
+        for condition in item_status.conditions or ()
+    ]
+
+    # Store the selector for fetching pod metrics
+    selector = spec.selector
+    selector_labels = (selector.match_labels if selector else None) or {}
+
+    return DeploymentRecord(
+        name=metadata.name,
+        namespace=metadata.namespace,
+        game=game,
+        instance=annotations.get(INSTANCE_ANNOTATION, "unknown"),
+        component=annotations.get(COMPONENT_ANNOTATION, "unknown"),
+        replicas=spec.replicas,
+        available_replicas=available_replicas,
+        unavailable_replicas=item_status.unavailable_replicas or 0,
+        status=status,
+        conditions=conditions,
+        cpu_usage=None,
+        memory_usage=None,
+        selector_labels=selector_labels,
+        files_url=annotations.get(FILES_URL_ANNOTATION),
+    )
+
+
+async def list_deployment_records(
+    list_fn: Callable[..., Awaitable[Any]], **kwargs: Any
+) -> List[DeploymentRecord]:
+    """List deployments page by page, keeping only game server deployments.
+
+    Pages are decoded with orjson instead of being deserialized into
+    V1Deployment objects, and each page is reduced to DeploymentRecord
+    objects before the next one is requested, so deployments without the
+    game annotation are dropped right away.
+
+    Args:
+        list_fn: Generated list_*deployment* API method
+        **kwargs: Arguments for list_fn, see list_pages()
+
+    Returns:
+        List of deployment status objects
+    """
+    deployments = []
+    async for response in list_pages(list_fn, _preload_content=False, **kwargs):
+        for item in response["items"]:
+            deployment = process_deployment_dict(item)
+            if deployment:
+                deployments.append(deployment)
+    return deployments
+
+
+def process_deployment_dict(item: Dict[str, Any]) -> Optional[DeploymentRecord]:
+    """Process a single decoded deployment, see process_deployment_item().
+
+    Builds the same DeploymentRecord from the deployment's JSON as
+    process_deployment_item() does from the client's model object.
+
+    Args:
+        item: Kubernetes deployment as decoded JSON
+
+    Returns:
+        DeploymentRecord object or None if not a game server deployment
+    """
+    metadata = item["metadata"]
+    spec = item.get("spec") or {}
+    item_status = item.get("status") or {}
+
+    annotations = metadata.get("annotations") or {}
+    game = annotations.get(GAME_ANNOTATION) or (metadata.get("labels") or {}).get(GAME_LABEL)
+
+    if not game:
+        return None  # Skip deployments without our game annotation
+
+    replicas = spec.get("replicas")
+    available_replicas = item_status.get("availableReplicas") or 0
+    status = "active" if replicas == 0 or available_replicas > 0 else "failed"
+
+    conditions = [
+        {
+            "type": condition.get("type"),
+            "status": condition.get("status"),
+            "message": condition.get("message"),
+            "last_transition_time": _isoformat(condition.get("lastTransitionTime")),
+        }
+        for condition in item_status.get("conditions") or ()
+    ]
+
+    return DeploymentRecord(
+        name=metadata["name"],
+        namespace=metadata["namespace"],
+        game=game,
+        instance=annotations.get(INSTANCE_ANNOTATION, "unknown"),
+        component=annotations.get(COMPONENT_ANNOTATION, "unknown"),
+        replicas=replicas,
+        available_replicas=available_replicas,
+        unavailable_replicas=item_status.get("unavailableReplicas") or 0,
+        status=status,
+        conditions=conditions,
+        cpu_usage=None,
+        memory_usage=None,
+        selector_labels=(spec.get("selector") or {}).get("matchLabels") or {},
+        files_url=annotations.get(FILES_URL_ANNOTATION),
+    )
+
+
+def _isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """Convert an API server timestamp to datetime.isoformat() notation.
+
+    Args:
+        timestamp: RFC 3339 timestamp in UTC, e.g. 2024-01-01T00:00:00Z
+
+    Returns:
+        Timestamp as formatted by the client's datetime models
+    """
+    if timestamp and timestamp.endswith("Z"):
+        return timestamp[:-1] + "+00:00"
+    return timestamp
+
+
+def process_pod_item(pod) -> Dict[str, Any]:
+    """Process a Kubernetes pod into the pod summary returned by the API.
+
+    Args:
+        pod: Kubernetes pod object
+
+    Returns:
+        Dict with the pod's name, namespace, status, creation time, containers
+        and annotations
+    """
+    # Extract container information
+    containers = [
+        {"name": container.name, "image": container.image}
+        for container in pod.spec.containers
+    ]
+    
+    # Determine pod status and age
+    status = "Unknown"
+    if pod.status.phase:
+        status = pod.status.phase
+    
+    # For running pods, check if all containers are ready
+    if status == "Running":
+        if pod.status.container_statuses:
+            all_ready = all(cs.ready for cs in pod.status.container_statuses)
+            if not all_ready:
+                status = "NotReady"
+    
+    # Get creation timestamp
+    created_at = pod.metadata.creation_timestamp
+    
+    # Get annotations including the default container if it exists
+    annotations = {}
+    if pod.metadata.annotations:
+        annotations = pod.metadata.annotations
+        
+    return {
+        "name": pod.metadata.name,
+        "namespace": pod.metadata.namespace,
+        "status": status,
+        "created_at": created_at.isoformat() if created_at else None,
+        "containers": containers,
+        "annotations": annotations
+    }
+
+
 class KubernetesClient:
     """Client for interacting with the Kubernetes API."""
 
-    def __init__(self, api_client: Optional[ApiClient] = None):
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        cache: Optional["DeploymentCache"] = None,
+    ):
         """Initialize the Kubernetes client.
 
         Args:
             api_client: Optional pre-configured Kubernetes API client
+            cache: Optional watch-backed deployment cache to serve reads from
         """
         self.api_client = api_client
+        self.cache = cache
         self._apps_v1_api = None
         self._core_v1_api = None
         self._custom_objects_api = None
+        self._authorization_v1_api = None
+        # Reads currently in progress, shared by identical concurrent calls
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # (namespace, game) -> (expiry, deployments) of recent direct LISTs
+        self._list_cache: Dict[
+            Tuple[Optional[str], Optional[str]], Tuple[float, List[DeploymentRecord]]
+        ] = {}
+        # key -> (expiry, result) of recent namespace probes and metrics reads
+        self._result_cache: Dict[str, Tuple[float, Any]] = {}
+        # Bounds concurrent API requests of fan-out operations
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     @property
     def apps_v1_api(self):
@@ -101,100 +563,175 @@ class KubernetesClient:
         if self._custom_objects_api is None:
             self._custom_objects_api = client.CustomObjectsApi(api_client=self.api_client)
         return self._custom_objects_api
+
+    @property
+    def authorization_v1_api(self):
+        """Get the Authorization V1 API client."""
+        if self._authorization_v1_api is None:
+            self._authorization_v1_api = client.AuthorizationV1Api(api_client=self.api_client)
+        return self._authorization_v1_api
+
+    async def _bounded(self, coro_fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Run an API call while holding the client's concurrency semaphore.
+
+        Args:
+            coro_fn: Coroutine function to call
+            *args: Positional arguments for coro_fn
+            **kwargs: Keyword arguments for coro_fn
+
+        Returns:
+            Result of the call
+        """
+        async with self._semaphore:
+            return await coro_fn(*args, **kwargs)
+
+    async def _coalesce(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Share a single in-flight call between identical concurrent requests.
+
+        The first caller starts the work, later callers with the same key
+        await its result instead of issuing their own API requests. The work
+        is shielded so that a cancelled caller does not cancel it for the rest.
+
+        Args:
+            key: Identifies the request, e.g. method name and arguments
+            factory: Starts the actual work when no identical call is running
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._coalesced_done, key))
+        return await asyncio.shield(task)
+
+    def _coalesced_done(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished shared call, see _coalesce().
+
+        Args:
+            key: Key the call was registered under
+            task: The finished call
+        """
+        self._inflight.pop(key, None)
+        # Retrieve the exception, as every waiter may have been cancelled
+        # before the call failed and nobody else would
+        if not task.cancelled():
+            task.exception()
+
+    async def _cached(self, key: str, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Reuse the result of a call for ttl seconds.
+
+        Misses go through _coalesce(), so concurrent callers of an expired
+        entry share a single refresh.
+
+        Args:
+            key: Identifies the request, e.g. method name and arguments
+            ttl: Seconds the result is reused, 0 disables reuse
+            factory: Starts the actual work on a miss
+
+        Returns:
+            Result of the (possibly cached) call
+        """
+        now = time.monotonic()
+        entry = self._result_cache.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        result = await self._coalesce(key, factory)
+        if ttl > 0:
+            if len(self._result_cache) >= RESULT_CACHE_PRUNE_SIZE:
+                self._result_cache = {
+                    k: v for k, v in self._result_cache.items() if now < v[0]
+                }
+            self._result_cache[key] = (time.monotonic() + ttl, result)
+        return result
         
     def _parse_cpu_metrics(self, cpu_str: str) -> float:
         """Parse CPU metrics string to millicores."""
         if not cpu_str:
             return 0
-        if cpu_str.endswith('m'):
-            return float(cpu_str[:-1])
-        # Handle "n" suffix (nanocores)
-        if cpu_str.endswith('n'):
-            return float(cpu_str[:-1]) / 1_000_000
-        # Regular cores
-        return float(cpu_str) * 1000
+        return parse_cpu_quantity(cpu_str)
 
     def _parse_memory_metrics(self, memory_str: str) -> int:
         """Parse memory metrics string to bytes."""
         if not memory_str:
             return 0
-        
-        # Handle Ki, Mi, Gi, etc.
-        units = {'Ki': 2**10, 'Mi': 2**20, 'Gi': 2**30, 'Ti': 2**40}
-        for suffix, multiplier in units.items():
-            if memory_str.endswith(suffix):
-                return int(float(memory_str[:-2]) * multiplier)
-        
-        # Handle K, M, G, etc.
-        units = {'K': 10**3, 'M': 10**6, 'G': 10**9, 'T': 10**12}
-        for suffix, multiplier in units.items():
-            if memory_str.endswith(suffix):
-                return int(float(memory_str[:-1]) * multiplier)
-        
-        # Handle raw bytes
-        return int(memory_str)
+        return parse_memory_quantity(memory_str)
 
     def _format_cpu(self, millicores: float) -> str:
         """Format CPU millicores for display."""
         if millicores >= 1000:
-            return f"{millicores/1000:.2f} cores"
+            return f"{millicores / 1000:.2f} cores"
         return f"{int(millicores)}m"
 
     def _format_memory(self, bytes_val: int) -> str:
         """Format memory bytes for display."""
-        if bytes_val >= 2**30:
-            return f"{bytes_val/2**30:.2f}Gi"
-        if bytes_val >= 2**20:
-            return f"{bytes_val/2**20:.2f}Mi"
-        if bytes_val >= 2**10:
-            return f"{bytes_val/2**10:.2f}Ki"
-        return f"{bytes_val}B"
+        # Every 10 bits are one binary unit step, capped at Gi
+        unit = min((bytes_val.bit_length() - 1) // 10, 3) if bytes_val > 0 else 0
+        if unit == 0:
+            return f"{bytes_val}B"
+        divisor, suffix = _MEMORY_DISPLAY_UNITS[unit]
+        return f"{bytes_val / divisor:.2f}{suffix}"
         
     async def get_pod_metrics(self, namespace: str, label_selector: Optional[str] = None) -> Dict[str, Any]:
         """Fetch pod metrics from the metrics API.
+
+        Results are reused for METRICS_CACHE_TTL seconds; the metrics server
+        only scrapes every few seconds anyway.
         
         Args:
             namespace: Namespace to query
             label_selector: Optional label selector to filter pods
             
         Returns:
-            Dictionary mapping pod names to their metrics
+            Dictionary mapping pod names to their raw usage, as "cpu_raw"
+            millicores and "memory_raw" bytes, and the pod's "labels"
         """
+        return await self._cached(
+            f"metrics:{namespace}:{label_selector}",
+            METRICS_CACHE_TTL,
+            lambda: self._get_pod_metrics(namespace, label_selector),
+        )
+
+    async def _get_pod_metrics(self, namespace: str, label_selector: Optional[str]) -> Dict[str, Any]:
+        """Fetch pod metrics from the metrics API, see get_pod_metrics()."""
         try:
-            # Try to access the metrics API
-            result = self.custom_objects_api.list_namespaced_custom_object(
-                group="metrics.k8s.io",
-                version="v1beta1",
-                namespace=namespace,
-                plural="pods",
-                label_selector=label_selector
+            # Try to access the metrics API, decoding the response with orjson
+            result = await _read_json(
+                await self.custom_objects_api.list_namespaced_custom_object(
+                    group="metrics.k8s.io",
+                    version="v1beta1",
+                    namespace=namespace,
+                    plural="pods",
+                    label_selector=label_selector,
+                    _preload_content=False,
+                )
             )
             
+            # Only raw values are kept per pod; display strings are formatted
+            # once for the per-deployment totals
+            parse_cpu = self._parse_cpu_metrics
+            parse_memory = self._parse_memory_metrics
             metrics = {}
             for item in result.get("items", []):
-                pod_name = item["metadata"]["name"]
-                containers = item.get("containers", [])
-                
+                metadata = item["metadata"]
                 total_cpu = 0
                 total_memory = 0
+                try:
+                    for container in item.get("containers", []):
+                        usage = container.get("usage", {})
+                        # CPU comes in formats like "100m" or "1", memory like "100Ki" or "1Gi"
+                        total_cpu += parse_cpu(usage.get("cpu", "0"))
+                        total_memory += parse_memory(usage.get("memory", "0"))
+                except ValueError as e:
+                    # Skip only this pod, the rest of the namespace is still usable
+                    logger.warning(f"Skipping metrics of pod {metadata['name']}: {e}")
+                    continue
                 
-                for container in containers:
-                    usage = container.get("usage", {})
-                    # Parse CPU (comes in formats like "100m" or "1")
-                    cpu_str = usage.get("cpu", "0")
-                    cpu_value = self._parse_cpu_metrics(cpu_str)
-                    total_cpu += cpu_value
-                    
-                    # Parse memory (comes in formats like "100Ki" or "1Gi")
-                    memory_str = usage.get("memory", "0")
-                    memory_value = self._parse_memory_metrics(memory_str)
-                    total_memory += memory_value
-                
-                metrics[pod_name] = {
-                    "cpu": self._format_cpu(total_cpu),
-                    "memory": self._format_memory(total_memory),
+                metrics[metadata["name"]] = {
                     "cpu_raw": total_cpu,
-                    "memory_raw": total_memory
+                    "memory_raw": total_memory,
+                    "labels": metadata.get("labels") or {},
                 }
                 
             return metrics
@@ -207,126 +744,201 @@ class KubernetesClient:
 
     async def _get_accessible_namespaces(self) -> List[str]:
         """Get a list of namespaces the current user can access.
+
+        The probe result is reused for NAMESPACE_CACHE_TTL seconds.
         
         Returns:
             List of namespace names
         """
+        return await self._cached(
+            "namespaces", NAMESPACE_CACHE_TTL, self._probe_accessible_namespaces
+        )
+
+    async def _probe_accessible_namespaces(self) -> List[str]:
+        """Probe which namespaces deployments can be listed in, see _get_accessible_namespaces()."""
         try:
-            namespaces = self.core_v1_api.list_namespace()
-            accessible_namespaces = []
+            names = [
+                ns.metadata.name
+                async for response in list_pages(self.core_v1_api.list_namespace)
+                for ns in response.items
+            ]
             
-            for ns in namespaces.items:
-                try:
-                    # Try a simple operation to check if user can access this namespace
-                    self.apps_v1_api.list_namespaced_deployment(namespace=ns.metadata.name, limit=1)
-                    accessible_namespaces.append(ns.metadata.name)
-                except ApiException as e:
-                    if e.status == 403:  # Forbidden
-                        # Skip namespaces the user can't access
-                        continue
-                    else:
-                        # Re-raise other errors
-                        raise
+            # Check the user's permissions in all namespaces concurrently
+            probes = await asyncio.gather(
+                *(self._bounded(self._can_list_deployments, name) for name in names),
+                return_exceptions=True,
+            )
+            accessible_namespaces = []
+            for name, probe in zip(names, probes):
+                if isinstance(probe, BaseException):
+                    # Re-raise errors
+                    raise probe
+                if probe:
+                    accessible_namespaces.append(name)
                         
-            print(f"DEBUG: Found {len(accessible_namespaces)} accessible namespaces: {accessible_namespaces}")
+            logger.debug("Found %d accessible namespaces", len(accessible_namespaces))
             return accessible_namespaces
         except ApiException as e:
             logger.warning(f"Cannot list namespaces, will use default namespace only: {e}")
             return ["default"]
 
-    async def _process_deployment_item(self, item) -> Optional[DeploymentStatus]:
-        """Process a single deployment item to create a DeploymentStatus object.
-        
+    async def _can_list_deployments(self, namespace: str) -> bool:
+        """Check whether the current user may list deployments in a namespace.
+
+        Asks the API server for the user's rules in the namespace with a
+        SelfSubjectRulesReview, which is much cheaper than a LIST. Only when
+        the review is incomplete and grants nothing, e.g. with a webhook
+        authorizer, the namespace is probed with a one item LIST.
+
         Args:
-            item: Kubernetes deployment object
-            
+            namespace: Namespace to check
+
         Returns:
-            DeploymentStatus object or None if not a game server deployment
+            True if deployments can be listed in the namespace
         """
-        # Check if the deployment has our game annotations
-        annotations = item.metadata.annotations or {}
-        game = annotations.get(GAME_ANNOTATION)
-        
-        if not game:
-            return None  # Skip deployments without our game annotation
-            
-        instance = annotations.get(INSTANCE_ANNOTATION, "unknown")
-        component = annotations.get(COMPONENT_ANNOTATION, "unknown")
-        
-        # Get deployment status
-        available_replicas = item.status.available_replicas or 0
-        unavailable_replicas = item.status.unavailable_replicas or 0
-        
-        # Determine if the deployment is active or failed
-        if (
-            item.spec.replicas == 0 
-            or (item.status.available_replicas is not None 
-                and item.status.available_replicas > 0)
-        ):
-            status = "active"
-        else:
-            status = "failed"
-        
-        # Extract conditions
-        conditions = []
-        if item.status.conditions:
-            for condition in item.status.conditions:
-                conditions.append({
-                    "type": condition.type,
-                    "status": condition.status,
-                    "message": condition.message,
-                    "last_transition_time": condition.last_transition_time.isoformat()
-                    if condition.last_transition_time else None,
-                })
-        
-        # Store the selector for fetching pod metrics
-        selector_labels = {}
-        if item.spec.selector and item.spec.selector.match_labels:
-            selector_labels = item.spec.selector.match_labels
-        
-        # Extract files URL annotation if it exists
-        files_url = annotations.get(FILES_URL_ANNOTATION)
-        
-        return DeploymentStatus(
-            name=item.metadata.name,
-            namespace=item.metadata.namespace,
-            game=game,
-            instance=instance,
-            component=component,
-            replicas=item.spec.replicas,
-            available_replicas=available_replicas,
-            unavailable_replicas=unavailable_replicas,
-            status=status,
-            conditions=conditions,
-            selector_labels=selector_labels,
-            files_url=files_url
+        review = await self.authorization_v1_api.create_self_subject_rules_review(
+            body=client.V1SelfSubjectRulesReview(
+                spec=client.V1SelfSubjectRulesReviewSpec(namespace=namespace)
+            )
         )
+        for rule in review.status.resource_rules or []:
+            api_groups = rule.api_groups or []
+            resources = rule.resources or []
+            if (
+                ("apps" in api_groups or "*" in api_groups)
+                and ("deployments" in resources or "*" in resources)
+                and ("list" in rule.verbs or "*" in rule.verbs)
+            ):
+                return True
+        if not review.status.incomplete:
+            return False
 
-    async def _fetch_deployments(self, namespace: Optional[str] = None) -> List[DeploymentStatus]:
+        try:
+            await self.apps_v1_api.list_namespaced_deployment(namespace=namespace, limit=1)
+            return True
+        except ApiException as e:
+            if e.status == 403:  # Forbidden
+                return False
+            raise
+
+    async def _fetch_deployments(
+        self, namespace: Optional[str] = None, game: Optional[str] = None
+    ) -> List[DeploymentRecord]:
         """Get all game server deployments from the Kubernetes API without metrics.
         
-        This is a helper method to get deployment data.
+        This is a helper method to get deployment data. When a synced deployment
+        cache is available it is used instead of listing from the API server;
+        the returned objects are then shared and must not be modified.
+        Otherwise the result of a LIST is reused for LIST_CACHE_TTL seconds.
         
         Args:
             namespace: Optional namespace to filter deployments
+            game: Optional game name to filter deployments
             
         Returns:
             List of deployment status objects
         """
+        if self.cache is not None and self.cache.synced:
+            if game:
+                deployments = self.cache.deployments_for_game(game)
+                if namespace:
+                    deployments = [d for d in deployments if d.namespace == namespace]
+                return deployments
+            return self.cache.deployments(namespace)
+
+        # A fresh unfiltered LIST serves any game
+        deployments = self._fresh_list(namespace, None)
+        if deployments is not None:
+            if game:
+                deployments = [d for d in deployments if d.game == game]
+            return deployments
+
+        # Let the API server select a single game when deployments are labeled
+        label_selector = DEPLOYMENT_LABEL_SELECTOR
+        selected_game = None
+        if game and DEPLOYMENT_LABEL_SELECTOR == GAME_LABEL:
+            if len(game) > 63 or not _LABEL_VALUE_RE.match(game):
+                # No labeled deployment can belong to it, and the API server
+                # would reject the selector
+                return []
+            label_selector = f"{GAME_LABEL}={game}"
+            selected_game = game
+        deployments = self._fresh_list(namespace, selected_game)
+        if deployments is None:
+            deployments = await self._coalesce(
+                f"list:{namespace}:{label_selector}",
+                lambda: self._list_deployments(namespace, label_selector),
+            )
+            if LIST_CACHE_TTL > 0:
+                now = time.monotonic()
+                # Keys come from the request, drop expired entries now and then
+                if len(self._list_cache) >= RESULT_CACHE_PRUNE_SIZE:
+                    self._list_cache = {
+                        k: v for k, v in self._list_cache.items() if now < v[0]
+                    }
+                self._list_cache[(namespace, selected_game)] = (
+                    now + LIST_CACHE_TTL, deployments
+                )
+
+        # The game name comes from the annotation, which the label should match
+        if game:
+            deployments = [d for d in deployments if d.game == game]
+        return deployments
+
+    def _fresh_list(
+        self, namespace: Optional[str], game: Optional[str]
+    ) -> Optional[List[DeploymentRecord]]:
+        """Get the result of a recent direct LIST if it has not expired.
+
+        Args:
+            namespace: Namespace the LIST was restricted to, if any
+            game: Game the LIST was restricted to, if any
+
+        Returns:
+            Deployments from the LIST, or None if there is no fresh result
+        """
+        entry = self._list_cache.get((namespace, game))
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def _lookup_deployment(self, namespace: str, name: str) -> Optional[DeploymentRecord]:
+        """Find a deployment in the deployment cache or a still fresh LIST.
+
+        Args:
+            namespace: Namespace of the deployment
+            name: Name of the deployment
+
+        Returns:
+            Deployment record, or None if no cached copy is available
+        """
+        if self.cache is not None and self.cache.synced:
+            return self.cache.get(namespace, name)
+        now = time.monotonic()
+        for expiry, deployments in self._list_cache.values():
+            if now < expiry:
+                for deployment in deployments:
+                    if deployment.namespace == namespace and deployment.name == name:
+                        return deployment
+        return None
+
+    async def _list_deployments(
+        self, namespace: Optional[str], label_selector: Optional[str]
+    ) -> List[DeploymentRecord]:
+        """List game server deployments from the API server, see _fetch_deployments()."""
         try:
             deployments = []
             
             # If specific namespace is provided, only query that one
             if namespace:
                 try:
-                    response = self.apps_v1_api.list_namespaced_deployment(namespace=namespace)
-                    print(f"DEBUG: Found {len(response.items)} deployments in namespace {namespace}")
-                    
-                    # Process each deployment
-                    for item in response.items:
-                        deployment = await self._process_deployment_item(item)
-                        if deployment:
-                            deployments.append(deployment)
+                    deployments = await list_deployment_records(
+                        self.apps_v1_api.list_namespaced_deployment,
+                        namespace=namespace,
+                        label_selector=label_selector,
+                        resource_version=WATCH_CACHE_RESOURCE_VERSION,
+                    )
+                    logger.debug("Found %d deployments in namespace %s", len(deployments), namespace)
                             
                 except ApiException as e:
                     logger.error(f"Error retrieving deployments from namespace {namespace}: {e}")
@@ -335,35 +947,42 @@ class KubernetesClient:
             else:
                 # Try to query all namespaces first (cluster-level access)
                 try:
-                    response = self.apps_v1_api.list_deployment_for_all_namespaces()
-                    print(f"DEBUG: Found {len(response.items)} deployments in all namespaces")
-                    
-                    # Process each deployment
-                    for item in response.items:
-                        deployment = await self._process_deployment_item(item)
-                        if deployment:
-                            deployments.append(deployment)
+                    deployments = await list_deployment_records(
+                        self.apps_v1_api.list_deployment_for_all_namespaces,
+                        label_selector=label_selector,
+                        resource_version=WATCH_CACHE_RESOURCE_VERSION,
+                    )
+                    logger.debug("Found %d deployments in all namespaces", len(deployments))
                 except ApiException as e:
                     if e.status == 403:  # Forbidden - user doesn't have cluster-level access
-                        print("DEBUG: Cannot list deployments at cluster scope, falling back to namespace-level queries")
+                        logger.debug("Cannot list deployments at cluster scope, listing per namespace")
                         
                         # Get namespaces the user can access
                         namespaces = await self._get_accessible_namespaces()
                         
-                        # Query each namespace individually
-                        for ns in namespaces:
-                            try:
-                                response = self.apps_v1_api.list_namespaced_deployment(namespace=ns)
-                                print(f"DEBUG: Found {len(response.items)} deployments in namespace {ns}")
-                                
-                                # Process each deployment
-                                for item in response.items:
-                                    deployment = await self._process_deployment_item(item)
-                                    if deployment:
-                                        deployments.append(deployment)
-                            except ApiException as ns_error:
+                        # Query all namespaces individually, concurrently
+                        results = await asyncio.gather(
+                            *(
+                                self._bounded(
+                                    list_deployment_records,
+                                    self.apps_v1_api.list_namespaced_deployment,
+                                    namespace=ns,
+                                    label_selector=label_selector,
+                                    resource_version=WATCH_CACHE_RESOURCE_VERSION,
+                                )
+                                for ns in namespaces
+                            ),
+                            return_exceptions=True,
+                        )
+                        for ns, records in zip(namespaces, results):
+                            if isinstance(records, ApiException):
                                 # Log the error but continue with other namespaces
-                                logger.warning(f"Error retrieving deployments from namespace {ns}: {ns_error}")
+                                logger.warning(f"Error retrieving deployments from namespace {ns}: {records}")
+                                continue
+                            if isinstance(records, BaseException):
+                                raise records
+                            logger.debug("Found %d deployments in namespace %s", len(records), ns)
+                            deployments.extend(records)
                     else:
                         # For other errors, raise the exception
                         raise e
@@ -375,67 +994,52 @@ class KubernetesClient:
                 status_code=500,
                 detail=f"Error retrieving deployments: {str(e)}",
             )
-    async def get_deployments(self, namespace: Optional[str] = None) -> List[DeploymentStatus]:
+
+    async def get_deployments(
+        self, namespace: Optional[str] = None, game: Optional[str] = None
+    ) -> List[DeploymentRecord]:
         """Get all game server deployments from the Kubernetes API and enrich with metrics.
 
+        Concurrent calls with the same arguments share one set of API requests,
+        and repeated calls within one HTTP request return the same result.
+
         Args:
             namespace: Optional namespace to filter deployments
+            game: Optional game name to filter deployments
 
         Returns:
             List of deployment status objects with metrics
         """
+        key = f"deployments:{namespace}:{game}"
+        memo = _request_memo.get()
+        if memo is not None and key in memo:
+            return memo[key]
+        deployments = await self._coalesce(
+            key, lambda: self._get_deployments(namespace, game)
+        )
+        if memo is not None:
+            memo[key] = deployments
+        return deployments
+
+    async def _get_deployments(
+        self, namespace: Optional[str], game: Optional[str]
+    ) -> List[DeploymentRecord]:
+        """Fetch deployments and enrich them with metrics, see get_deployments()."""
         try:
-            deployments = await self._fetch_deployments(namespace)
+            deployments = await self._fetch_deployments(namespace, game)
             
-            # Fetch metrics for each deployment
+            # Fetch metrics with one request per namespace, all namespaces
+            # concurrently
+            by_namespace = defaultdict(list)
             for deployment in deployments:
-                try:
-                    # Get labels for this deployment's pods
-                    label_selectors = []
-                    
-                    # Use the deployment's selector labels
-                    if deployment.selector_labels:
-                        for key, value in deployment.selector_labels.items():
-                            label_selectors.append(f"{key}={value}")
-                        print(f"DEBUG: Using selector labels for {deployment.namespace}/{deployment.name}: {label_selectors}")
-                    else:
-                        # Fallback to app=name if no selector available
-                        app_label = f"app={deployment.name}"
-                        label_selectors.append(app_label)
-                        print(f"DEBUG: Using fallback selector '{app_label}' for {deployment.namespace}/{deployment.name}")
-                    
-                    label_selector = ",".join(label_selectors)
-                    
-                    # Fetch pod metrics for this deployment
-                    pod_metrics = await self.get_pod_metrics(
-                        namespace=deployment.namespace,
-                        label_selector=label_selector
-                    )
-                    
-                    # Log if we found any metrics
-                    if pod_metrics:
-                        print(f"DEBUG: Found metrics for {len(pod_metrics)} pods in {deployment.namespace}/{deployment.name}")
-                    else:
-                        print(f"DEBUG: No pod metrics found for {deployment.namespace}/{deployment.name} with selector {label_selector}")
-                    
-                    if pod_metrics:
-                        # Aggregate metrics across all pods
-                        total_cpu = sum(m["cpu_raw"] for m in pod_metrics.values())
-                        total_memory = sum(m["memory_raw"] for m in pod_metrics.values())
-                        
-                        # Add to deployment
-                        deployment.cpu_usage = self._format_cpu(total_cpu)
-                        deployment.memory_usage = self._format_memory(total_memory)
-                    else:
-                        # No metrics available
-                        deployment.cpu_usage = "N/A"
-                        deployment.memory_usage = "N/A"
-                except Exception as e:
-                    logger.error(f"Error fetching metrics for deployment {deployment.namespace}/{deployment.name}: {e}")
-                    deployment.cpu_usage = "Error"
-                    deployment.memory_usage = "Error"
-                    
-            return deployments
+                by_namespace[deployment.namespace].append(deployment)
+            enriched = {}
+            for records in await asyncio.gather(
+                *(self._bounded(self._with_metrics, ns, items) for ns, items in by_namespace.items())
+            ):
+                for deployment in records:
+                    enriched[(deployment.namespace, deployment.name)] = deployment
+            return [enriched[(d.namespace, d.name)] for d in deployments]
         except ApiException as e:
             logger.error(f"Error retrieving deployments: {e}")
             raise HTTPException(
@@ -443,48 +1047,121 @@ class KubernetesClient:
                 detail=f"Error retrieving deployments: {str(e)}",
             )
 
+    async def _with_metrics(
+        self, namespace: str, deployments: List[DeploymentRecord]
+    ) -> List[DeploymentRecord]:
+        """Get copies of a namespace's deployments with pod resource usage filled in.
+
+        A namespace holding a single deployment is queried with that
+        deployment's selector. Otherwise the metrics of all pods in the
+        namespace are fetched once and assigned to the deployments by label.
+
+        Cached deployment objects are shared between requests, so metrics go
+        onto a copy. Errors are reported in the usage fields, not raised.
+
+        Args:
+            namespace: Namespace of the deployments
+            deployments: Deployments to fetch metrics for
+
+        Returns:
+            Deployment records with cpu_usage and memory_usage set
+        """
+        # Use the deployments' selector labels, falling back to app=name
+        selectors = [d.selector_labels or {"app": d.name} for d in deployments]
+        label_selector = None
+        if len(deployments) == 1:
+            label_selector = label_selector_for(tuple(selectors[0].items()))
+        try:
+            pod_metrics = await self.get_pod_metrics(
+                namespace=namespace,
+                label_selector=label_selector
+            )
+        except Exception as e:
+            logger.error(f"Error fetching metrics for deployments in namespace {namespace}: {e}")
+            return [
+                dataclasses.replace(d, cpu_usage=METRICS_ERROR, memory_usage=METRICS_ERROR)
+                for d in deployments
+            ]
+
+        # Index pods by label so each deployment only checks candidate pods
+        pods_by_label = defaultdict(list)
+        if label_selector is None:
+            for metrics in pod_metrics.values():
+                for label in metrics["labels"].items():
+                    pods_by_label[label].append(metrics)
+
+        result = []
+        for deployment, labels in zip(deployments, selectors):
+            if label_selector is not None:
+                pods = list(pod_metrics.values())
+            else:
+                candidates = pods_by_label.get(next(iter(labels.items())), ())
+                pods = [m for m in candidates if labels.items() <= m["labels"].items()]
+            
+            if pods:
+                # Aggregate metrics across all pods
+                cpu_usage = self._format_cpu(sum(m["cpu_raw"] for m in pods))
+                memory_usage = self._format_memory(sum(m["memory_raw"] for m in pods))
+            else:
+                # No metrics available
+                cpu_usage = METRICS_UNAVAILABLE
+                memory_usage = METRICS_UNAVAILABLE
+            result.append(
+                dataclasses.replace(deployment, cpu_usage=cpu_usage, memory_usage=memory_usage)
+            )
+        return result
+
     async def get_games(self) -> List[Game]:
         """Get a list of all games with their instance counts.
 
         Returns:
             List of game objects
         """
-        deployments = await self.get_deployments()
+        if self.cache is not None and self.cache.synced:
+            return self.cache.games()
+        return await self._coalesce("games", self._get_games)
+
+    async def _get_games(self) -> List[Game]:
+        """Build the game summaries from a fresh deployment list."""
+        # Resource metrics are not part of the game summary, so skip fetching them
+        deployments = await self._fetch_deployments()
         
         # Group deployments by game
-        games = {}
+        games = defaultdict(
+            lambda: {"instances": set(), "components": set(), "failing_deployments": 0}
+        )
         for deployment in deployments:
-            game_name = deployment.game
-            
-            if game_name not in games:
-                games[game_name] = {
-                    "name": game_name,
-                    "instances": set(),
-                    "components": set(),
-                    "failing_deployments": 0,
-                }
-            
-            games[game_name]["instances"].add(deployment.instance)
-            games[game_name]["components"].add(f"{deployment.instance}/{deployment.component}")
-            
+            data = games[deployment.game]
+            data["instances"].add(deployment.instance)
+            data["components"].add((deployment.instance, deployment.component))
             if deployment.status == "failed":
-                games[game_name]["failing_deployments"] += 1
+                data["failing_deployments"] += 1
         
-        # Convert to Game model
-        result = []
-        for game_name, data in games.items():
-            result.append(
-                Game(
-                    name=data["name"],
-                    instance_count=len(data["instances"]),
-                    component_count=len(data["components"]),
-                    failing_deployments=data["failing_deployments"],
-                )
+        # Convert to Game model, the counts are computed here so skip validation
+        return [
+            Game.model_construct(
+                name=game_name,
+                instance_count=len(data["instances"]),
+                component_count=len(data["components"]),
+                failing_deployments=data["failing_deployments"],
             )
-        
-        return sorted(result, key=lambda g: g.name)
+            for game_name, data in sorted(games.items())
+        ]
+
+    async def get_games_json(self) -> bytes:
+        """Get the list of all games serialized as a JSON array.
+
+        Served straight from the deployment cache when available, which keeps
+        the encoded response until the next deployment change.
+
+        Returns:
+            JSON encoded list of game objects
+        """
+        if self.cache is not None and self.cache.synced:
+            return self.cache.games_json()
+        return orjson.dumps([g.model_dump() for g in await self.get_games()])
 
-    async def get_game_instances(self, game_name: str) -> List[GameInstance]:
+    async def get_game_instances(self, game_name: str) -> List[GameInstanceRecord]:
         """Get all instances for a specific game.
 
         Args:
@@ -493,35 +1170,21 @@ class KubernetesClient:
         Returns:
             List of game instance objects
         """
-        deployments = await self.get_deployments()
-        
-        # Filter deployments by game name
-        game_deployments = [d for d in deployments if d.game == game_name]
-        
-        # Group deployments by instance
-        instances = {}
-        for deployment in game_deployments:
-            instance_name = deployment.instance
-            
-            if instance_name not in instances:
-                instances[instance_name] = {
-                    "name": instance_name,
-                    "components": [],
-                }
-            
-            instances[instance_name]["components"].append(deployment)
-        
-        # Convert to GameInstance model
-        result = []
-        for instance_name, data in instances.items():
-            result.append(
-                GameInstance(
-                    name=data["name"],
-                    components=sorted(data["components"], key=lambda d: d.component),
-                )
-            )
+        return await self._coalesce(
+            f"game_instances:{game_name}",
+            lambda: self._get_game_instances(game_name),
+        )
+
+    async def _get_game_instances(self, game_name: str) -> List[GameInstanceRecord]:
+        """Group a game's deployments by instance, see get_game_instances()."""
+        game_deployments = await self.get_deployments(game=game_name)
         
-        return sorted(result, key=lambda i: i.name)
+        # Sort once by instance and component, then group by instance
+        game_deployments = sorted(game_deployments, key=attrgetter("instance", "component"))
+        return [
+            GameInstanceRecord(name=instance_name, components=list(components))
+            for instance_name, components in groupby(game_deployments, key=attrgetter("instance"))
+        ]
 
     async def scale_deployment(self, namespace: str, name: str, replicas: int) -> Dict[str, Any]:
         """Scale a specific deployment to the specified number of replicas.
@@ -535,21 +1198,13 @@ class KubernetesClient:
             Status information about the scale operation
         """
         try:
-            # Get the current deployment
-            deployment = self.apps_v1_api.read_namespaced_deployment(
-                name=name,
-                namespace=namespace,
-            )
-            
-            # Update replicas
-            deployment.spec.replicas = replicas
-            
-            # Apply the update
-            self.apps_v1_api.patch_namespaced_deployment(
+            # Patch the scale subresource, which only carries the replica count
+            await self.apps_v1_api.patch_namespaced_deployment_scale(
                 name=name,
                 namespace=namespace,
                 body={"spec": {"replicas": replicas}},
             )
+            self._list_cache.clear()
             
             action = "started" if replicas > 0 else "stopped"
             return {
@@ -580,19 +1235,19 @@ class KubernetesClient:
                     "template": {
                         "metadata": {
                             "annotations": {
-                                "kubectl.kubernetes.io/restartedAt": 
-                                    client.ApiClient().sanitize_for_serialization(__import__('datetime').datetime.now().isoformat())
+                                RESTART_ANNOTATION: datetime.now(timezone.utc).isoformat()
                             }
                         }
                     }
                 }
             }
             
-            self.apps_v1_api.patch_namespaced_deployment(
+            await self.apps_v1_api.patch_namespaced_deployment(
                 name=name,
                 namespace=namespace,
                 body=patch_body,
             )
+            self._list_cache.clear()
             
             return {
                 "status": "success", 
@@ -604,6 +1259,43 @@ class KubernetesClient:
                 status_code=500,
                 detail=f"Error restarting deployment: {str(e)}",
             )
+
+    async def batch_deployment_action(
+        self, action: str, deployments: List[Dict[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """Start, stop or restart several deployments concurrently.
+
+        Args:
+            action: One of "start", "stop" or "restart"
+            deployments: Deployments to act on, as dicts with namespace and name
+
+        Returns:
+            Per-deployment status information, in the order of the request
+        """
+        if action == "restart":
+            calls = [
+                self._bounded(self.restart_deployment, d["namespace"], d["name"])
+                for d in deployments
+            ]
+        else:
+            replicas = 1 if action == "start" else 0
+            calls = [
+                self._bounded(self.scale_deployment, d["namespace"], d["name"], replicas)
+                for d in deployments
+            ]
+
+        results = []
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        for deployment, outcome in zip(deployments, outcomes):
+            if isinstance(outcome, HTTPException):
+                outcome = {"status": "error", "message": outcome.detail}
+            elif isinstance(outcome, Exception):
+                logger.error(
+                    f"Error running {action} on {deployment['namespace']}/{deployment['name']}: {outcome}"
+                )
+                outcome = {"status": "error", "message": str(outcome)}
+            results.append({**deployment, **outcome})
+        return results
             
     async def get_deployment_pods(self, namespace: str, name: str) -> List[Dict[str, Any]]:
         """Get pods for a specific deployment.
@@ -616,68 +1308,19 @@ class KubernetesClient:
             List of pods belonging to the deployment
         """
         try:
-            # First get the deployment to check its selector
-            deployment = self.apps_v1_api.read_namespaced_deployment(
-                name=name,
-                namespace=namespace
-            )
-            
-            # Extract label selector from the deployment
-            selectors = []
-            for key, value in deployment.spec.selector.match_labels.items():
-                selectors.append(f"{key}={value}")
-                
-            label_selector = ",".join(selectors)
-            
-            # Get pods with this label selector
-            pods = self.core_v1_api.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=label_selector
-            )
-            
-            result = []
-            for pod in pods.items:
-                # Extract container information
-                containers = []
-                for container in pod.spec.containers:
-                    containers.append({
-                        "name": container.name,
-                        "image": container.image
-                    })
-                
-                # Determine pod status and age
-                status = "Unknown"
-                if pod.status.phase:
-                    status = pod.status.phase
-                
-                # For running pods, check if all containers are ready
-                if status == "Running":
-                    if pod.status.container_statuses:
-                        all_ready = all(cs.ready for cs in pod.status.container_statuses)
-                        if not all_ready:
-                            status = "NotReady"
-                
-                # Get creation timestamp
-                created_at = pod.metadata.creation_timestamp
-                
-                # Get annotations including the default container if it exists
-                annotations = {}
-                if pod.metadata.annotations:
-                    annotations = pod.metadata.annotations
-                    
-                result.append({
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": status,
-                    "created_at": created_at.isoformat() if created_at else None,
-                    "containers": containers,
-                    "annotations": annotations
-                })
-
-                print(f"DEBUG: Found pod {pod.metadata.name} with status {status} in {namespace}/{name}: {result[-1]}")
-                
+            match_labels = await self._get_pod_selector(namespace, name)
+            result = [
+                process_pod_item(pod)
+                async for response in list_pages(
+                    self.core_v1_api.list_namespaced_pod,
+                    namespace=namespace,
+                    label_selector=label_selector_for(tuple(match_labels.items())),
+                    resource_version=WATCH_CACHE_RESOURCE_VERSION,
+                )
+                for pod in response.items
+            ]
             # Sort by creation time (newest first)
-            result.sort(key=lambda p: p.get("created_at", ""), reverse=True)
+            result.sort(key=lambda p: p["created_at"] or "", reverse=True)
             return result
             
         except ApiException as e:
@@ -686,6 +1329,28 @@ class KubernetesClient:
                 status_code=500,
                 detail=f"Error getting pods for deployment: {str(e)}",
             )
+
+    async def _get_pod_selector(self, namespace: str, name: str) -> Dict[str, str]:
+        """Get the matchLabels pod selector of a deployment.
+
+        Takes the selector from a cached copy of the deployment, only reading
+        the deployment when none is available.
+
+        Args:
+            namespace: Namespace of the deployment
+            name: Name of the deployment
+
+        Returns:
+            Label names and values the deployment's pods carry
+        """
+        cached = self._lookup_deployment(namespace, name)
+        if cached is not None and cached.selector_labels:
+            return cached.selector_labels
+        deployment = await self.apps_v1_api.read_namespaced_deployment(
+            name=name,
+            namespace=namespace
+        )
+        return deployment.spec.selector.match_labels or {}
             
     async def get_pod_logs(self, namespace: str, pod_name: str, container: Optional[str] = None, 
                          tail_lines: int = 100) -> str:
@@ -704,7 +1369,7 @@ class KubernetesClient:
             # If no container specified, check for default container annotation
             if not container:
                 try:
-                    pod = self.core_v1_api.read_namespaced_pod(
+                    pod = await self.core_v1_api.read_namespaced_pod(
                         name=pod_name, 
                         namespace=namespace
                     )
@@ -712,14 +1377,13 @@ class KubernetesClient:
                     # Check for the default container annotation
                     if pod.metadata.annotations and "kubectl.kubernetes.io/default-container" in pod.metadata.annotations:
                         container = pod.metadata.annotations["kubectl.kubernetes.io/default-container"]
-                        print(f"Using default container '{container}' from annotation")
+                        logger.debug("Using default container %s from annotation", container)
                 except Exception as e:
                     logger.warning(f"Error checking default container annotation: {e}")
             
             # Now get the logs
             if container:
-                print(f"Getting logs for pod {namespace}/{pod_name}, container: {container}")
-                logs = self.core_v1_api.read_namespaced_pod_log(
+                logs = await self.core_v1_api.read_namespaced_pod_log(
                     name=pod_name,
                     namespace=namespace,
                     container=container,
@@ -727,8 +1391,7 @@ class KubernetesClient:
                     pretty=True,
                 )
             else:
-                print(f"Getting logs for pod {namespace}/{pod_name}, no container specified")
-                logs = self.core_v1_api.read_namespaced_pod_log(
+                logs = await self.core_v1_api.read_namespaced_pod_log(
                     name=pod_name,
                     namespace=namespace,
                     tail_lines=tail_lines
@@ -743,111 +1406,310 @@ class KubernetesClient:
             )
 
 
-def get_k8s_client_config(authorization_header: Optional[str] = None) -> ApiClient:
+def _new_api_client(configuration: Optional[client.Configuration] = None) -> ApiClient:
+    """Create an instrumented API client that asks for compressed responses.
+
+    Args:
+        configuration: Optional client configuration, the default one otherwise
+
+    Returns:
+        API client
+    """
+    api_client = ApiClient(configuration)
+    # LIST responses compress very well; aiohttp decompresses them transparently
+    api_client.default_headers["Accept-Encoding"] = K8S_ACCEPT_ENCODING
+    instrument_api_client(api_client)
+    # Wrapped after instrumenting, so every attempt is recorded
+    rest_client = api_client.rest_client
+    rest_client.request = _retry_throttled(rest_client.request)
+    return api_client
+
+
+def _retry_throttled(request: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wrap RESTClientObject.request to back off from API server throttling.
+
+    API Priority and Fairness rejects requests it cannot queue with 429 and a
+    Retry-After header; such requests were not executed, so they are retried
+    up to THROTTLE_RETRIES times after the advertised delay.
+    """
+
+    async def throttled_request(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        for attempt in range(THROTTLE_RETRIES + 1):
+            try:
+                response = await request(method, url, *args, **kwargs)
+            except ApiException as e:
+                if e.status != 429 or attempt == THROTTLE_RETRIES:
+                    raise
+                headers = e.headers or {}
+            else:
+                # Requests with _preload_content=False return error responses
+                if response.status != 429 or attempt == THROTTLE_RETRIES:
+                    return response
+                headers = response.headers
+                response.release()
+            delay = _retry_after(headers.get("Retry-After"))
+            logger.warning(f"Kubernetes API throttled {method} {url}, retrying in {delay}s")
+            THROTTLE_RETRIES_TOTAL.labels(method).inc()
+            await asyncio.sleep(delay)
+
+    return throttled_request
+
+
+def _retry_after(value: Optional[str]) -> float:
+    """Get the delay from a Retry-After header, in seconds.
+
+    Args:
+        value: Header value, the API server sends whole seconds
+
+    Returns:
+        Delay, 1s if the header is missing or malformed
+    """
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        delay = 1.0
+    return min(max(delay, 0.0), THROTTLE_MAX_DELAY_SECONDS)
+
+
+@functools.lru_cache(maxsize=1)
+def _token_configuration_template() -> client.Configuration:
+    """Build the configuration shared by all per-token API clients.
+
+    Only the api_key differs between tokens, so get_k8s_client_config()
+    copies this template instead of building a Configuration per token.
+
+    Returns:
+        Client configuration without credentials
+    """
+    configuration = client.Configuration()
+    configuration.host = os.environ.get("K8S_API_SERVER", "https://kubernetes.default.svc")
+    if os.path.isfile(K8S_CA_CERT):
+        configuration.ssl_ca_cert = K8S_CA_CERT
+        configuration.verify_ssl = True
+    else:
+        configuration.verify_ssl = False  # For development
+    # A single user needs far fewer connections than the shared client.
+    # kubernetes_asyncio has no client-side QPS limiter, and it ignores
+    # configuration.retries; the pool size (aiohttp connection limit)
+    # is the only client-side bound, throttling by the API server is
+    # handled by _retry_throttled().
+    configuration.connection_pool_maxsize = TOKEN_CLIENT_POOL_SIZE
+    # No prefix needed since we're sending the complete header
+    configuration.api_key_prefix = {}
+    return configuration
+
+
+async def get_k8s_client_config(authorization_header: Optional[str] = None) -> ApiClient:
     """Get a configured Kubernetes API client.
 
+    The returned client owns an aiohttp session and must be closed by the
+    caller once it is no longer needed.
+
     Args:
         authorization_header: Optional Bearer token from the request Authorization header
 
     Returns:
         Configured API client
     """
+    # First try to use the authorization header if provided (from OIDC proxy)
+    if authorization_header and authorization_header.startswith("Bearer "):
+        # Direct header approach - pass the complete Authorization header as-is
+        # Copy a configuration that sends the Authorization header verbatim
+        configuration = copy.copy(_token_configuration_template())
+        logger.debug("Using bearer token authentication against %s", configuration.host)
+        
+        # Manually add the Authorization header to every request
+        # This is the key part - we pass the complete header as is
+        configuration.api_key = {"BearerToken": authorization_header}
+        
+        return _new_api_client(configuration)
+        
+    # Next try to use in-cluster configuration
     try:
-        # First try to use the authorization header if provided (from OIDC proxy)
-        if authorization_header and authorization_header.startswith("Bearer "):
-            token = authorization_header.split(" ", 1)[1].strip()
-            api_server = os.environ.get("K8S_API_SERVER", "https://kubernetes.default.svc")
-            
-            # Debug logging
-            print(f"DEBUG TOKEN LENGTH: {len(token)} characters")
-            print(f"DEBUG API SERVER: {api_server}")
-            
-            # Direct header approach - pass the complete Authorization header as-is
-            print("USING DIRECT HEADER APPROACH - CONFIRMED WORKING")
-            # Create a configuration that sends the Authorization header verbatim
-            configuration = client.Configuration()
-            configuration.host = api_server
-            configuration.verify_ssl = False  # For development
-            
-            # Manually add the Authorization header to every request
-            # This is the key part - we pass the complete header as is
-            configuration.api_key = {"authorization": authorization_header}
-            # No prefix needed since we're sending the complete header
-            configuration.api_key_prefix = {}
-            
-            api_client = ApiClient(configuration)
-            return api_client
-            
-        # Next try to use in-cluster configuration
+        config.load_incluster_config()
+        logger.info("Using in-cluster Kubernetes configuration")
+        return _new_api_client()
+    except config.ConfigException:
+        logger.debug("In-cluster config failed, trying kubeconfig")
+
+    # Fall back to kubeconfig
+    if os.path.exists(os.path.expanduser("~/.kube/config")):
         try:
-            config.load_incluster_config()
-            logger.info("Using in-cluster Kubernetes configuration")
-            print("USING IN-CLUSTER CONFIG")
-            return ApiClient()
-        except config.ConfigException:
-            print("In-cluster config failed, trying kubeconfig")
-            pass
-
-        # Fall back to kubeconfig
-        if os.path.exists(os.path.expanduser("~/.kube/config")):
-            config.load_kube_config()
-            logger.info("Using kubeconfig for Kubernetes configuration")
-            print("USING KUBECONFIG")
-            return ApiClient()
-        
-        logger.error("No valid Kubernetes configuration found")
-        print("NO VALID K8S CONFIG")
-        raise HTTPException(
-            status_code=500,
-            detail="No valid Kubernetes configuration found",
-        )
-    except Exception as e:
-        logger.error(f"Error configuring Kubernetes client: {e}")
-        print(f"ERROR CONFIGURING K8S CLIENT: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error configuring Kubernetes client: {str(e)}",
-        )
+            await config.load_kube_config()
+        except Exception as e:
+            logger.error(f"Error configuring Kubernetes client: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error configuring Kubernetes client: {str(e)}",
+            )
+        logger.info("Using kubeconfig for Kubernetes configuration")
+        return _new_api_client()
+    
+    logger.error("No valid Kubernetes configuration found")
+    raise HTTPException(
+        status_code=500,
+        detail="No valid Kubernetes configuration found",
+    )
+
+
+class TokenClientCache:
+    """LRU cache of KubernetesClient instances for per-user bearer tokens.
+
+    Each entry owns its own API client (and connection pool), so repeated
+    requests with the same token reuse open connections to the API server.
+    Entries are keyed by a SHA-256 digest of the header to avoid keeping the
+    tokens themselves as dictionary keys. Clients that have not been used for
+    idle_seconds are dropped on the next lookup.
+
+    Requests hold a client from acquire() until release(). A client dropped
+    from the cache (evicted or idle) while requests still hold it is only
+    closed once the last of them releases it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = TOKEN_CLIENT_CACHE_SIZE,
+        idle_seconds: float = TOKEN_CLIENT_IDLE_SECONDS,
+    ):
+        """Initialize the token client cache.
+
+        Args:
+            maxsize: Maximum number of clients to keep open
+            idle_seconds: Time after which an unused client is closed
+        """
+        self.maxsize = maxsize
+        self.idle_seconds = idle_seconds
+        # key -> (client, last use), least recently used first
+        self._clients: "OrderedDict[str, Tuple[KubernetesClient, float]]" = OrderedDict()
+        # client -> number of requests currently holding it
+        self._leases: Dict[KubernetesClient, int] = {}
+        # Clients dropped from the cache, closed once their last lease is released
+        self._retired: Set[KubernetesClient] = set()
+
+    async def acquire(self, authorization_header: str) -> KubernetesClient:
+        """Get the client for a bearer token, creating it if needed.
+
+        The client must be handed back with release() once the request is done
+        with it.
+
+        Args:
+            authorization_header: Complete Authorization header value
+
+        Returns:
+            KubernetesClient authenticating with the given token
+        """
+        now = time.monotonic()
+        await self._close_idle(now)
+
+        key = hashlib.sha256(authorization_header.encode()).hexdigest()
+        entry = self._clients.get(key)
+        if entry is not None:
+            k8s_client = entry[0]
+            self._clients[key] = (k8s_client, now)
+            self._clients.move_to_end(key)
+        else:
+            api_client = await get_k8s_client_config(authorization_header)
+            k8s_client = KubernetesClient(api_client=api_client)
+            self._clients[key] = (k8s_client, now)
+            if len(self._clients) > self.maxsize:
+                _, (evicted, _) = self._clients.popitem(last=False)
+                await self._discard(evicted)
+        self._leases[k8s_client] = self._leases.get(k8s_client, 0) + 1
+        return k8s_client
+
+    async def release(self, k8s_client: KubernetesClient) -> None:
+        """Hand back a client obtained from acquire().
+
+        Args:
+            k8s_client: Client the request is done with
+        """
+        leases = self._leases.pop(k8s_client, 0) - 1
+        if leases > 0:
+            self._leases[k8s_client] = leases
+        elif leases < 0 or k8s_client in self._retired:
+            # Retired, or no longer tracked because close() ran while the
+            # request held it (closing twice is harmless)
+            self._retired.discard(k8s_client)
+            await k8s_client.api_client.close()
+
+    async def _discard(self, k8s_client: KubernetesClient) -> None:
+        """Close a client dropped from the cache, or once no request holds it.
+
+        Args:
+            k8s_client: Client that was removed from the cache
+        """
+        if k8s_client in self._leases:
+            self._retired.add(k8s_client)
+        else:
+            await k8s_client.api_client.close()
+
+    async def _close_idle(self, now: float) -> None:
+        """Close clients that have not been used for idle_seconds.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        while self._clients:
+            key, (k8s_client, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self.idle_seconds:
+                break  # Entries are ordered by last use, the rest are newer
+            del self._clients[key]
+            await self._discard(k8s_client)
+
+    async def close(self) -> None:
+        """Close all cached clients."""
+        while self._clients:
+            _, (k8s_client, _) = self._clients.popitem()
+            await k8s_client.api_client.close()
+        while self._retired:
+            await self._retired.pop().api_client.close()
+        self._leases.clear()
+
 
+async def get_k8s_client(request: Request) -> AsyncIterator[KubernetesClient]:
+    """Get the KubernetesClient to use for the current request.
 
-async def get_k8s_client(request: Request = None) -> KubernetesClient:
-    """Get a configured KubernetesClient instance.
+    Requests carrying their own bearer token use a client cached per token,
+    held until the request is done so it is not closed while still in use.
+    All other requests share the application-wide client created at startup,
+    which is backed by the deployment cache.
 
     Args:
         request: FastAPI request to extract authorization header
 
-    Returns:
+    Yields:
         KubernetesClient instance
     """
-    # Log all headers to help troubleshoot OAuth proxy issues
-    print("=== DEBUGGING: REQUEST HEADERS START ===")
-    if request:
-        for header_name, header_value in request.headers.items():
-            # For security, don't log the full token
-            if header_name.lower() == "authorization":
-                print(f"  {header_name}: {header_value[:15]}...")
-            else:
-                print(f"  {header_name}: {header_value}")
-    else:
-        print("  No request object provided!")
-    print("=== DEBUGGING: REQUEST HEADERS END ===")
+    # Log headers to help troubleshoot OAuth proxy issues, without the tokens
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Request headers: %s",
+            {k: v for k, v in request.headers.items() if k not in AUTH_HEADERS},
+        )
 
-    # First try standard Authorization header
+    _request_memo.set({})
+
+    # Try the standard Authorization header, then the alternatives proxies use
+    headers = request.headers
     authorization_header = None
-    if request:
-        # Try standard Authorization header
-        authorization_header = request.headers.get("Authorization")
-        if not authorization_header:
-            # Try common alternative headers that might be used by proxies
-            authorization_header = request.headers.get("X-Forwarded-Authorization")
-        if not authorization_header:
-            # Check for Kubernetes specific auth header
-            authorization_header = request.headers.get("X-Auth-Token")
-    
-    if authorization_header:
-        print(f"Found authorization header type: {authorization_header[:10]}...")
-    else:
-        print("No authorization header found in the request")
+    for header in AUTH_HEADERS:
+        authorization_header = headers.get(header)
+        if authorization_header:
+            break
     
-    api_client = get_k8s_client_config(authorization_header)
-    return KubernetesClient(api_client=api_client)
+    if authorization_header and authorization_header.startswith("Bearer "):
+        token_clients = request.app.state.k8s_token_clients
+        k8s_client = await token_clients.acquire(authorization_header)
+        try:
+            yield k8s_client
+        finally:
+            await token_clients.release(k8s_client)
+        return
+
+    k8s_client = request.app.state.k8s
+    if k8s_client is None:
+        raise HTTPException(
+            status_code=500,
+            detail="No valid Kubernetes configuration found",
+        )
+    yield k8s_client
@@ -0,0 +1,107 @@
+"""
+Prometheus instrumentation of the Kubernetes API client.
+"""
+import time
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlsplit
+
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.exceptions import ApiException
+from prometheus_client import Counter, Histogram
+
+# Buckets of the request latency histogram, up to the 10s a slow LIST can take
+REQUEST_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+REQUEST_LATENCY = Histogram(
+    "k8s_client_request_latency_seconds",
+    "Latency of Kubernetes API requests until the response headers arrived",
+    ["verb", "host", "path", "code"],
+    buckets=REQUEST_LATENCY_BUCKETS,
+)
+REQUESTS_TOTAL = Counter(
+    "k8s_client_requests_total",
+    "Kubernetes API requests by response code",
+    ["verb", "host", "code"],
+)
+THROTTLED_TOTAL = Counter(
+    "k8s_client_throttled_total",
+    "Kubernetes API requests rejected with 429 Too Many Requests",
+    ["verb", "host", "path"],
+)
+THROTTLE_RETRIES_TOTAL = Counter(
+    "k8s_client_retries_total",
+    "Kubernetes API requests retried after being throttled",
+    ["verb"],
+)
+
+
+def path_template(path: str) -> str:
+    """Replace namespace and object names in an API path with placeholders.
+
+    Keeps the label cardinality bounded by the set of resources, e.g.
+    /apis/apps/v1/namespaces/games/deployments/web/scale becomes
+    /apis/apps/v1/namespaces/{namespace}/deployments/{name}/scale.
+
+    Args:
+        path: Request path without query string
+
+    Returns:
+        Path template
+    """
+    parts = path.split("/")
+    # ["", "api", version, ...] or ["", "apis", group, version, ...]
+    if len(parts) > 1 and parts[1] == "api":
+        start = 3
+    elif len(parts) > 1 and parts[1] == "apis":
+        start = 4
+    else:
+        return path
+    if len(parts) > start + 2 and parts[start] == "namespaces":
+        parts[start + 1] = "{namespace}"
+        start += 2
+    # parts[start] is the resource, an object name may follow it
+    if len(parts) > start + 1:
+        parts[start + 1] = "{name}"
+    return "/".join(parts)
+
+
+def instrument_api_client(api_client: ApiClient) -> ApiClient:
+    """Record latency and outcome of every request made through an API client.
+
+    Args:
+        api_client: API client to instrument
+
+    Returns:
+        The same API client
+    """
+    rest_client = api_client.rest_client
+    rest_client.request = _instrumented(rest_client.request)
+    return api_client
+
+
+def _instrumented(request: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wrap RESTClientObject.request to observe the request metrics."""
+
+    async def instrumented_request(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        code = "<error>"
+        try:
+            response = await request(method, url, *args, **kwargs)
+            code = str(response.status)
+            return response
+        except ApiException as e:
+            code = str(e.status)
+            raise
+        finally:
+            parsed = urlsplit(url)
+            path = path_template(parsed.path)
+            REQUEST_LATENCY.labels(method, parsed.netloc, path, code).observe(
+                time.perf_counter() - start
+            )
+            REQUESTS_TOTAL.labels(method, parsed.netloc, code).inc()
+            if code == "429":
+                THROTTLED_TOTAL.labels(method, parsed.netloc, path).inc()
+
+    return instrumented_request
@@ -6,15 +6,22 @@ Main application module that initializes FastAPI and serves the web application.
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
 
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Template
+from markupsafe import escape
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.types import Receive, Scope, Send
 
 from app.api import router as api_router
-from app.kubernetes import get_k8s_client
+from app.kubernetes import DeploymentCache, KubernetesClient, get_k8s_client
+from app.kubernetes.client import TokenClientCache, get_k8s_client_config
 
 # Configure logging - this is important to see our debug messages
 logging.basicConfig(
@@ -25,79 +32,230 @@ logging.basicConfig(
     ]
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared Kubernetes clients and deployment cache for the app."""
+    app.state.k8s = None
+    app.state.k8s_token_clients = TokenClientCache()
+    try:
+        api_client = await get_k8s_client_config()
+    except HTTPException as e:
+        # Requests carrying their own bearer token can still be served
+        logging.warning(f"No shared Kubernetes client available: {e.detail}")
+    else:
+        deployment_cache = DeploymentCache(api_client)
+        deployment_cache.start()
+        app.state.k8s = KubernetesClient(api_client=api_client, cache=deployment_cache)
+    try:
+        yield
+    finally:
+        await app.state.k8s_token_clients.close()
+        if app.state.k8s is not None:
+            await app.state.k8s.cache.stop()
+            await app.state.k8s.api_client.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Game Server Dashboard",
     description="Dashboard for managing game server deployments in Kubernetes",
     version="0.1.0",
+    lifespan=lifespan,
+    # Response models are serialized by pydantic-core and rendered with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Initialize templates
+# Response of the health check, encoded once
+HEALTH_RESPONSE_BODY = b'{"status":"ok"}'
+HEALTH_RESPONSE_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_RESPONSE_BODY)).encode()),
+]
+
+# Development mode: uvicorn reloads the code on changes and templates are
+# looked up again on every render, so edits to them are picked up as well
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Initialize templates; outside debug mode they are compiled once and never
+# checked for changes on disk again, see current_template()
 templates = Jinja2Templates(directory="app/templates")
+INDEX_TEMPLATE = templates.get_template("index.html")
+GAME_TEMPLATE = templates.get_template("game.html")
+ERROR_TEMPLATE = templates.get_template("error.html")
+
+# Placeholders the error page shells are rendered with, see render_error()
+ERROR_TITLE_MARKER = "@@ERROR_TITLE@@"
+ERROR_MESSAGE_MARKER = "@@ERROR_MESSAGE@@"
+# Maximum number of base URLs (hosts the app is reached under) to keep
+# prerendered error pages for
+ERROR_PAGE_CACHE_SIZE = 16
+# base URL -> error page split around the title and the message
+_error_pages: Dict[str, Tuple[str, str, str]] = {}
 
 # Include API router
 app.include_router(api_router.router, prefix="/api")
 
 
+def current_template(template: Template) -> Template:
+    """Get the version of a preloaded template to render.
+
+    In debug mode the template is looked up again, which recompiles it when the
+    file changed on disk.
+
+    Args:
+        template: Template loaded at import
+
+    Returns:
+        The template itself, or its current version in debug mode
+    """
+    if DEBUG:
+        return templates.get_template(template.name)
+    return template
+
+
+def render(
+    template: Template, context: Dict[str, Any], status_code: int = 200
+) -> HTMLResponse:
+    """Render a preloaded template into an HTML response.
+
+    Args:
+        template: Template to render
+        context: Template context, including the request for url_for()
+        status_code: HTTP status code of the response
+
+    Returns:
+        HTML response
+    """
+    return HTMLResponse(
+        current_template(template).render(context), status_code=status_code
+    )
+
+
+def render_error(request: Request, title: str, message: str) -> HTMLResponse:
+    """Render the error page without running the template engine.
+
+    The page is rendered once per base URL (the static asset links depend on
+    it) with placeholders, which are replaced by the escaped title and message
+    afterwards. This keeps the error path cheap while the API server is down
+    and every request ends up on it. In debug mode it is rendered every time.
+
+    Args:
+        request: FastAPI request the error page is for
+        title: Error title
+        message: Error message
+
+    Returns:
+        HTML response with status code 500
+    """
+    base_url = str(request.base_url)
+    parts = _error_pages.get(base_url)
+    if parts is None or DEBUG:
+        page = current_template(ERROR_TEMPLATE).render(
+            {
+                "request": request,
+                "error_title": ERROR_TITLE_MARKER,
+                "error_message": ERROR_MESSAGE_MARKER,
+            }
+        )
+        head, rest = page.split(ERROR_TITLE_MARKER)
+        middle, tail = rest.split(ERROR_MESSAGE_MARKER)
+        parts = (head, middle, tail)
+        if len(_error_pages) >= ERROR_PAGE_CACHE_SIZE:
+            _error_pages.clear()
+        _error_pages[base_url] = parts
+    head, middle, tail = parts
+    return HTMLResponse(
+        "".join((head, escape(title), middle, escape(message), tail)),
+        status_code=500,
+    )
+
+
+# The pages resolve their client inside their error handling (instead of
+# through Depends), so client setup failures render the error page as well
+page_k8s_client = asynccontextmanager(get_k8s_client)
+
+
 @app.get("/", response_class=HTMLResponse)
-async def root(
-    request: Request
-):
+async def root(request: Request):
     """Render the main dashboard page."""
     try:
-        # Create the k8s_client explicitly by passing the request
-        k8s_client = await get_k8s_client(request)
-        games = await k8s_client.get_games()
-        return templates.TemplateResponse(
-            "index.html", {"request": request, "games": games}
-        )
+        async with page_k8s_client(request) as k8s_client:
+            games = await k8s_client.get_games()
+        return render(INDEX_TEMPLATE, {"request": request, "games": games})
     except Exception as e:
         logging.error(f"Error rendering dashboard: {e}", exc_info=True)
-        return templates.TemplateResponse(
-            "error.html",
-            {
-                "request": request,
-                "error_message": str(e),
-                "error_title": "Error retrieving deployments",
-            },
-            status_code=500,
-        )
+        return render_error(request, "Error retrieving deployments", str(e))
 
 
 @app.get("/game/{game_name}", response_class=HTMLResponse)
-async def game_detail(
-    request: Request,
-    game_name: str,
-):
+async def game_detail(request: Request, game_name: str):
     """Render the game detail page with instance information."""
     try:
-        # Create the k8s_client explicitly by passing the request
-        k8s_client = await get_k8s_client(request)
-        instances = await k8s_client.get_game_instances(game_name)
-        return templates.TemplateResponse(
-            "game.html",
+        async with page_k8s_client(request) as k8s_client:
+            instances = await k8s_client.get_game_instances(game_name)
+        return render(
+            GAME_TEMPLATE,
             {"request": request, "game_name": game_name, "instances": instances},
         )
     except Exception as e:
         logging.error(f"Error rendering game detail: {e}", exc_info=True)
-        return templates.TemplateResponse(
-            "error.html",
+        return render_error(request, f"Error retrieving game {game_name}", str(e))
+
+
+class HealthCheck:
+    """Health check endpoint for the application.
+
+    Liveness and readiness probes call it every few seconds, so it is a plain
+    ASGI app answering with a constant body, bypassing FastAPI's request
+    parsing, dependency resolution and response serialization.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
             {
-                "request": request,
-                "error_message": str(e),
-                "error_title": f"Error retrieving game {game_name}",
-            },
-            status_code=500,
+                "type": "http.response.start",
+                "status": 200,
+                "headers": HEALTH_RESPONSE_HEADERS,
+            }
         )
+        await send({"type": "http.response.body", "body": HEALTH_RESPONSE_BODY})
+
+
+app.add_route("/health", HealthCheck(), methods=["GET"])
+
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Expose Prometheus metrics, e.g. Kubernetes API request latencies."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for the application."""
-    return {"status": "ok"}
+
+def worker_count() -> int:
+    """Get the number of worker processes to start.
+
+    WORKERS (or uvicorn's WEB_CONCURRENCY) sets the count; "auto" starts one
+    worker per CPU core. Defaults to a single worker, as every worker runs its
+    own deployment watch against the API server.
+
+    Returns:
+        Number of worker processes
+
+    Raises:
+        ValueError: If the setting is neither "auto" nor a positive number
+    """
+    name = "WORKERS" if "WORKERS" in os.environ else "WEB_CONCURRENCY"
+    workers = os.getenv(name, "1")
+    if workers == "auto":
+        return os.cpu_count() or 1
+    if not workers.isdigit() or int(workers) < 1:
+        raise ValueError(
+            f'{name} must be "auto" or a positive number of workers, got {workers!r}'
+        )
+    return int(workers)
 
 
 def start():
@@ -106,7 +264,12 @@ def start():
         "app.main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8000")),
-        reload=os.getenv("DEBUG", "false").lower() == "true",
+        reload=DEBUG,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Reloading runs a single process
+        workers=None if DEBUG else worker_count(),
         log_level="info",  # Set Uvicorn's log level to info
     )
 